@@ -13,12 +13,210 @@ import os
 import re
 import sys
 import csv
+import contextlib
 import argparse
-from typing import Dict, List, Tuple, Optional
+import traceback
+import functools
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Iterator, List, Tuple, Optional
 from datetime import datetime
 import fitz  # PyMuPDF
 
 
+# Text extraction flags: the block defaults, but with ligatures expanded to plain
+# letters (so "ﬁ" is searched as "fi") and no image blocks, which are never used
+_TEXT_FLAGS = fitz.TEXTFLAGS_BLOCKS & ~fitz.TEXT_PRESERVE_LIGATURES & ~fitz.TEXT_PRESERVE_IMAGES
+
+# Regular expressions are compiled once at import time and shared by every call.
+
+# Section endings shared by several Open Forum variants
+_ROMAN_SECTION_END = r"VI\.|Discussion Item|VII\.|Action Items|Motion|Adjournment"
+_NUMBERED_SECTION_END = r"6\.|Discussion Item|7\.|Action Items|Motion|Adjournment"
+
+# Open Forum section variants as (literal, header, section end), in order of
+# preference - including variations and encoding issues. The lowercase literal
+# occurs in every header match, so a variant is only searched for when a cheap
+# substring test finds its literal in the lowercased text. The garbled
+# "9. OSHQ FRUXP" header is covered by the generic garbled "9." variant, and any
+# "<number>. Open Forum" also contains a "[IV]*. Open Forum" match, so neither
+# needs a variant of its own.
+_OPEN_FORUM_VARIANTS = (
+    # Standard patterns
+    ("open forum", r"V\.\s*Open Forum", _ROMAN_SECTION_END),
+    ("open forum", r"5\.\s*Open Forum", _NUMBERED_SECTION_END),
+    ("open forum", r"Open Forum", r"Discussion Item|Action Items|Motion|Adjournment|Next Meeting"),
+
+    # Patterns with encoding variations (like OSHQ FRUXP)
+    ("v.", r"V\.\s*[A-Z]{4}\s+[A-Z]{5}", _ROMAN_SECTION_END),
+    ("5.", r"5\.\s*[A-Z]{4}\s+[A-Z]{5}", _NUMBERED_SECTION_END),
+    ("9.", r"9\.\s*[A-Z]{4}\s+[A-Z]{5}", _ROMAN_SECTION_END + r"|9I\.|10\.|AQQRXQFHPHQWV|AGMRXUQPHQW"),
+
+    # More flexible pattern
+    ("forum", r"[IV]*\.\s*[Oo]pen\s+[Ff]orum", r"[IV]*\.|Discussion|Action|Motion|Adjournment|Next Meeting"),
+)
+
+# Headers and section ends are searched separately: the section runs from the end of
+# the header to the first section end after it (or the end of the text), which is a
+# plain forward search instead of a lazy ".*?" re-testing the end at every character.
+_OPEN_FORUM_HEADER_RES = tuple(re.compile(header, re.IGNORECASE)
+                               for _, header, _ in _OPEN_FORUM_VARIANTS)
+_OPEN_FORUM_END_RES = tuple(re.compile(end, re.IGNORECASE)
+                            for _, _, end in _OPEN_FORUM_VARIANTS)
+
+# Phrases stating that the Open Forum had no comments
+_NO_COMMENT_PATTERNS = tuple(re.compile(pattern, re.IGNORECASE) for pattern in (
+    r"\b(no open forum|no comments?|none|n/?a|not applicable)\b",
+    r"\b(no public comment|no discussion|no speakers?)\b",
+    r"\b(no one spoke|no attendees|no participants)\b",
+    r"^\s*(none|n/?a)\s*\.?\s*$"
+))
+
+# Every 'no comments' phrase contains one of these (after lowercasing)
+_NO_COMMENT_LITERALS = ("no", "na", "n/a")
+
+# Paragraphs that are page furniture rather than comments
+_FILLER_PARAGRAPH_RE = re.compile(r'^\s*(page \d+|continued|end)\s*$', re.IGNORECASE)
+
+# Clear topic boundaries: a line break after a sentence ending, followed by either
+# - Person + asked/stated/etc, e.g.
+#   "...were listed.\nExternal Affairs Committee meeting times were asked by..."
+# - a "Per [Person]," statement that starts a new topic
+# Both share the same prefix, so one scan finds every boundary in order.
+_CLEAR_BOUNDARY_RE = re.compile(r'(?<=\.)\s*\n(?='
+                                r'[A-Z][a-zA-Z\s,&]+ (?:meeting times? were asked by|was asked by|asked by|stated by)'
+                                r'|Per [A-Z][a-zA-Z\s,]+,)')
+
+# Patterns that indicate a new speaker or comment, as one alternation
+# Look for patterns like "X was asked by [Name]" or "[Name] stated/asked/etc".
+# A match can only start at a sentence end and never spans another one, so a
+# single scan finds the same starting points as running each pattern separately.
+_SPEAKER_RE = re.compile(r'(?:^|\.\s+)(?:' + '|'.join([
+    r'[A-Z][a-zA-Z\s&,]+(?:asked|stated|mentioned|said|commented|noted|expressed|inquired|requested)\s+by\s+[A-Z][a-zA-Z\s,]+',
+    r'[A-Z][a-zA-Z\s&,]+\s+(?:was|were)\s+asked\s+by\s+[A-Z][a-zA-Z\s,]+',
+    r'Per\s+[A-Z][a-zA-Z\s,]+',
+]) + ')')
+
+# Every speaker pattern match contains one of these words
+_SPEAKER_KEYWORDS = ("asked", "stated", "mentioned", "said", "commented", "noted",
+                     "expressed", "inquired", "requested", "Per")
+
+_LEADING_PUNCTUATION_RE = re.compile(r'^[.\s]+')
+
+# Patterns that indicate administrative-only content
+_ADMIN_ONLY_PATTERNS = tuple(re.compile(pattern, re.IGNORECASE) for pattern in (
+    r'^[A-Za-z0-9\s\-:]+envelope\s+id[:\s]*[A-Za-z0-9\-]+\s*$',  # Just Docusign ID
+    r'^page\s+\d+(\s+of\s+\d+)?\s*$',  # Just page number
+    r'^continued\s*$',  # Just "continued"
+    r'^end\s*$',  # Just "end"
+    r'^\s*$',  # Just whitespace
+))
+
+# Words containing any of these are administrative
+_ADMIN_WORD_RE = re.compile(r'docusign|envelope|id|page|continued|end')
+
+# Administrative markers in short (lowercased) paragraphs
+_ADMIN_PARAGRAPH_PATTERNS = tuple(re.compile(pattern) for pattern in (
+    r'docusign\s+envelope\s+id:',
+    r'page\s+\d+',
+    r'^continued\s*$',
+    r'^end\s*$',
+    r'^\s*\d+\s*$',  # Just numbers
+    r'meeting\s+id:',
+    r'zoom\s+call:',
+    r'passcode:',
+))
+
+# Every administrative marker contains one of these, apart from bare numbers
+_ADMIN_PARAGRAPH_KEYWORDS = ("docusign", "page", "continued", "end", "meeting", "zoom", "passcode")
+
+# Common admin phrases removed from longer paragraphs before measuring what is left,
+# as one alternation so the paragraph is scanned once
+_ADMIN_PHRASE_RE = re.compile('|'.join([
+    r'docusign\s+envelope\s+id:\s*[a-f0-9\-]+',
+    r'page\s+\d+',
+    r'meeting\s+id:\s*\d+',
+    r'zoom\s+call:\s*https?://[^\s]+',
+    r'passcode:\s*\w+',
+]), re.IGNORECASE)
+
+# Blank lines between paragraphs; \s also covers the \r of Windows line endings,
+# so "\r\n\r\n" needs no separate branch
+_PARAGRAPH_SPLIT_RE = re.compile(r'\n\s*\n')
+
+# Date patterns for filenames - this covers virtually every conceivable format
+_DATE_PATTERNS = tuple(re.compile(pattern) for pattern in (
+    # Standard formats with various separators
+    r'(\d{1,2})[.\-_/](\d{1,2})[.\-_/](\d{4})',     # M.D.YYYY, M-D-YYYY, M_D_YYYY, M/D/YYYY
+    r'(\d{1,2})[.\-_/](\d{1,2})[.\-_/](\d{2})',      # M.D.YY, M-D-YY, M_D_YY, M/D/YY
+    r'(\d{4})[.\-_/](\d{1,2})[.\-_/](\d{1,2})',      # YYYY.M.D, YYYY-M-D, etc.
+
+    # With spaces before/after separators
+    r'\s+(\d{1,2})[.\-_/]\s*(\d{1,2})[.\-_/]\s*(\d{4})',  # " M. D. YYYY"
+    r'\s+(\d{1,2})[.\-_/]\s*(\d{1,2})[.\-_/]\s*(\d{2})',   # " M. D. YY"
+    r'(\d{1,2})\s*[.\-_/]\s*(\d{1,2})\s*[.\-_/]\s*(\d{4})', # "M . D . YYYY"
+    r'(\d{1,2})\s*[.\-_/]\s*(\d{1,2})\s*[.\-_/]\s*(\d{2})',  # "M . D . YY"
+
+    # Compact formats (no separators)
+    r'(\d{2})(\d{2})(\d{4})',    # MMDDYYYY
+    r'(\d{1})(\d{2})(\d{4})',    # MDDYYYY
+    r'(\d{2})(\d{1})(\d{4})',    # MMDYYYY
+    r'(\d{1})(\d{1})(\d{4})',    # MDYYYY
+    r'(\d{2})(\d{2})(\d{2})',    # MMDDYY
+
+    # With various word separators around dates
+    r'[a-zA-Z\s]+(\d{1,2})[.\-_/](\d{1,2})[.\-_/](\d{2,4})[a-zA-Z\s]*', # "Minutes 1.2.21 draft"
+))
+
+# Month names (January, Jan, etc.) found in one scan, with the month number of each name
+_MONTH_NAME_RE = re.compile(r'\b(jan|january|feb|february|mar|march|apr|april|may|jun|june|'
+                            r'jul|july|aug|august|sep|september|oct|october|nov|november|dec|december)\b')
+_MONTH_LOOKUP = {
+    'jan': 1, 'january': 1, 'feb': 2, 'february': 2, 'mar': 3, 'march': 3,
+    'apr': 4, 'april': 4, 'may': 5, 'jun': 6, 'june': 6, 'jul': 7, 'july': 7,
+    'aug': 8, 'august': 8, 'sep': 9, 'september': 9, 'oct': 10, 'october': 10,
+    'nov': 11, 'november': 11, 'dec': 12, 'december': 12,
+}
+
+# Day and year following a month name
+_MONTH_DAY_YEAR_RE = re.compile(r'.*?(\d{1,2}).*?(\d{2,4})')
+
+# Academic year folder names, e.g. 2020-2021
+_YEAR_FOLDER_RE = re.compile(r'\d{4}-\d{4}')
+
+# Reasons recorded for PDF files that yield no comment count
+_SKIP_NO_TEXT = "Failed to extract text"
+_SKIP_NO_OPEN_FORUM = "No Open Forum section found"
+_SKIP_NO_COMMENTS = "No comments or 'no comment' marker found"
+
+# Upper bound on worker processes; PDF parsing stops scaling beyond a handful of workers
+_MAX_WORKERS = 6
+_CHUNKS_PER_WORKER = 4
+
+# Write buffer for CSV exports
+_CSV_BUFFER_SIZE = 1 << 20
+_CSV_HEADER = "Academic_Year,Date,Comment_Count\r\n"
+
+# Row of the participation summary table: year, total, with comments, rate, comments
+_ROW_FMT = "{:<12} {:<7} {:<12} {:<7.1f}% {:<10}\n".format
+
+# Horizontal rules of the summary report
+_DOUBLE_RULE = "=" * 70
+_RULE = "-" * 70
+_SHORT_RULE = "-" * 50
+
+# Heading of the participation summary table, up to its first row
+_TABLE_HEADER = "".join([
+    "\n", _DOUBLE_RULE, "\n",
+    "📈 PARTICIPATION SUMMARY TABLE\n",
+    _DOUBLE_RULE, "\n",
+    f"{'Year':<12} {'Total':<7} {'w/Comments':<12} {'Rate':<8} {'Comments':<10}\n",
+    _RULE, "\n",
+])
+
+# Plural suffix indexed by whether a count is other than one
+_PLURAL_S = ('', 's')
+
+
 class AIMinutesAgent:
     """
     AI agent for processing committee meeting minutes and extracting public comments.
@@ -39,6 +237,44 @@ class AIMinutesAgent:
             'skipped_files': 0,
             'total_comments': 0
         }
+        # How often each Open Forum variant matched in this process, for tuning the
+        # variant table. Only filled in by serial (e.g. debug) runs: with a worker pool
+        # the counts stay in the workers' own agents and this remains all zeros.
+        self.open_forum_variant_hits = [0] * len(_OPEN_FORUM_VARIANTS)
+        self._reset_meeting_stats()
+    
+    def _reset_meeting_stats(self):
+        """
+        Clear the comprehensive meeting statistics, kept as one list per statistic
+        indexed like self.years (with year_index mapping each year to its position).
+        """
+        self.years = []
+        self.year_index = {}
+        self.total_meetings = []
+        self.meetings_with_comments = []
+        self.meetings_no_comments = []
+        self.meetings_no_open_forum = []
+        self.total_comments = []
+    
+    def iter_pdf_text(self, pdf_path: str) -> Iterator[Tuple[int, str]]:
+        """
+        Yield the text of a PDF file one page at a time.
+        
+        Text comes from PyMuPDF's layout blocks, which are the page's own paragraphs.
+        Blocks are separated by a blank line so that paragraph splitting in
+        count_public_comments follows the layout rather than stray line breaks.
+        
+        Args:
+            pdf_path (str): Path to the PDF file
+            
+        Yields:
+            Tuple[int, str]: (page_num, page_text) for each page, counting from 0
+        """
+        with fitz.open(pdf_path) as doc:
+            for page_num, page in enumerate(doc):
+                # Block tuples are (x0, y0, x1, y1, text, block_no, block_type); type 0 is text
+                blocks = page.get_textpage(flags=_TEXT_FLAGS).extractBLOCKS()
+                yield page_num, "".join(block[4].rstrip("\n") + "\n\n" for block in blocks if block[6] == 0)
     
     def extract_text_from_pdf(self, pdf_path: str) -> str:
         """
@@ -51,20 +287,22 @@ class AIMinutesAgent:
             str: Extracted text content
         """
         try:
-            doc = fitz.open(pdf_path)
-            full_text = ""
+            page_texts = []
             
-            for page_num, page in enumerate(doc):
-                page_text = page.get_text()
-                full_text += page_text
+            for page_num, page_text in self.iter_pdf_text(pdf_path):
+                page_texts.append(page_text)
                 
                 if self.debug_mode:
                     print(f"  Page {page_num + 1}: {len(page_text)} characters")
             
-            doc.close()
-            return full_text
+            # Join once at the end rather than growing one string page by page
+            return "".join(page_texts)
             
-        except Exception as e:
+        # PyMuPDF reports unreadable or damaged documents (including damaged pages
+        # part way through) as RuntimeError subclasses such as fitz.FileDataError,
+        # and encrypted or closed documents as ValueError; a missing or unreadable
+        # file is an OSError.
+        except (RuntimeError, ValueError, OSError) as e:
             print(f"Error reading PDF {pdf_path}: {e}")
             return ""
     
@@ -78,41 +316,42 @@ class AIMinutesAgent:
         Returns:
             Optional[str]: Open Forum section text, or None if not found
         """
-        # Pattern to match Open Forum section - including variations and encoding issues
-        patterns = [
-            # Standard patterns
-            r"V\.\s*Open Forum(.*?)(?=VI\.|Discussion Item|VII\.|Action Items|Motion|Adjournment|\Z)",
-            r"5\.\s*Open Forum(.*?)(?=6\.|Discussion Item|7\.|Action Items|Motion|Adjournment|\Z)",
-            r"Open Forum(.*?)(?=Discussion Item|Action Items|Motion|Adjournment|Next Meeting|\Z)",
-            
-            # Patterns with encoding variations (like OSHQ FRUXP)
-            r"V\.\s*[A-Z]{4}\s+[A-Z]{5}(.*?)(?=VI\.|Discussion Item|VII\.|Action Items|Motion|Adjournment|\Z)",
-            r"5\.\s*[A-Z]{4}\s+[A-Z]{5}(.*?)(?=6\.|Discussion Item|7\.|Action Items|Motion|Adjournment|\Z)",
-            r"9\.\s*[A-Z]{4}\s+[A-Z]{5}(.*?)(?=VI\.|Discussion Item|VII\.|Action Items|Motion|Adjournment|9I\.|10\.|AQQRXQFHPHQWV|AGMRXUQPHQW|\Z)",
-            
-            # Specific pattern for the garbled text we found
-            r"9\.\s*OSHQ\s+FRUXP(.*?)(?=9I\.|VI\.|Discussion Item|VII\.|Action Items|Motion|Adjournment|AQQRXQFHPHQWV|AGMRXUQPHQW|\Z)",
-            
-            # More flexible patterns
-            r"[IV]*\.\s*[Oo]pen\s+[Ff]orum(.*?)(?=[IV]*\.|Discussion|Action|Motion|Adjournment|Next Meeting|\Z)",
-            r"\d+\.\s*[Oo]pen\s+[Ff]orum(.*?)(?=\d+\.|Discussion|Action|Motion|Adjournment|Next Meeting|\Z)"
-        ]
-        
-        for i, pattern in enumerate(patterns):
-            match = re.search(pattern, text, re.DOTALL | re.IGNORECASE)
-            if match:
-                open_forum_text = match.group(1).strip()
-                
-                if self.debug_mode:
-                    print(f"  Found Open Forum section using pattern {i+1} ({len(open_forum_text)} characters)")
-                    print(f"  Preview: {open_forum_text[:200]}...")
-                
-                return open_forum_text
+        pattern_index, open_forum_text = self._find_open_forum_section(text)
+        if open_forum_text is not None:
+            self.open_forum_variant_hits[pattern_index] += 1
         
         if self.debug_mode:
-            print("  No Open Forum section found")
+            if open_forum_text is None:
+                print("  No Open Forum section found")
+            else:
+                print(f"  Found Open Forum section using pattern {pattern_index+1} ({len(open_forum_text)} characters)")
+                print(f"  Preview: {open_forum_text[:200]}...")
         
-        return None
+        return open_forum_text
+    
+    @staticmethod
+    def _find_open_forum_section(text: str) -> Tuple[int, Optional[str]]:
+        """
+        Search the text for the first matching Open Forum variant.
+        
+        Args:
+            text (str): Full text content of the minutes
+            
+        Returns:
+            Tuple[int, Optional[str]]: (variant index, section text), or (-1, None) if not found
+        """
+        lowered_text = text.lower()
+        
+        for i, header_re in enumerate(_OPEN_FORUM_HEADER_RES):
+            if _OPEN_FORUM_VARIANTS[i][0] not in lowered_text:
+                continue
+            header = header_re.search(text)
+            if header:
+                section_end = _OPEN_FORUM_END_RES[i].search(text, header.end())
+                end = section_end.start() if section_end else len(text)
+                return i, text[header.end():end].strip()
+        
+        return -1, None
     
     def has_no_comments(self, text: str) -> bool:
         """
@@ -124,17 +363,14 @@ class AIMinutesAgent:
         Returns:
             bool: True if section indicates no comments
         """
-        no_comment_patterns = [
-            r"\b(no open forum|no comments?|none|n/?a|not applicable)\b",
-            r"\b(no public comment|no discussion|no speakers?)\b",
-            r"\b(no one spoke|no attendees|no participants)\b",
-            r"^\s*(none|n/?a)\s*\.?\s*$"
-        ]
+        lowered_text = text.lower()
+        if not any(literal in lowered_text for literal in _NO_COMMENT_LITERALS):
+            return False
         
-        for pattern in no_comment_patterns:
-            if re.search(pattern, text, re.IGNORECASE):
+        for pattern in _NO_COMMENT_PATTERNS:
+            if pattern.search(text):
                 if self.debug_mode:
-                    print(f"  Found 'no comments' indicator: {pattern}")
+                    print(f"  Found 'no comments' indicator: {pattern.pattern}")
                 return True
         
         return False
@@ -152,17 +388,18 @@ class AIMinutesAgent:
         if not open_forum_text or self.has_no_comments(open_forum_text):
             return 0
         
-        # Clean the text
-        cleaned_text = re.sub(r'\s+', ' ', open_forum_text.strip())
-        
         # Check if the section only contains administrative/document metadata
         if self.is_only_admin_content(open_forum_text):
             if self.debug_mode:
                 print("  Open Forum section contains only administrative content (no public comments)")
             return 0
         
-        # Split into paragraphs (separated by double newlines or similar)
-        paragraphs = re.split(r'\n\s*\n|\r\n\s*\r\n', open_forum_text)
+        # Split into paragraphs (separated by double newlines or similar);
+        # without two line breaks there is no separator to split on
+        if open_forum_text.count("\n") < 2:
+            paragraphs = [open_forum_text]
+        else:
+            paragraphs = _PARAGRAPH_SPLIT_RE.split(open_forum_text)
         
         # Filter out empty or very short paragraphs and administrative content
         valid_paragraphs = []
@@ -170,7 +407,7 @@ class AIMinutesAgent:
             para = para.strip()
             # Consider valid if it has substantial content and isn't administrative
             if (len(para) > 20 and 
-                not re.match(r'^\s*(page \d+|continued|end)\s*$', para, re.IGNORECASE) and
+                not _FILLER_PARAGRAPH_RE.match(para) and
                 not self.is_admin_paragraph(para)):
                 
                 # Check for clear topic changes within a paragraph
@@ -200,26 +437,19 @@ class AIMinutesAgent:
         # Look for very clear speaker changes - sentences that end + person name + action verb
         # This is more conservative than the previous approach
         
-        # Pattern: Sentence ending + specific transition + Person + asked/stated/etc
-        # Example: "...were listed.\nExternal Affairs Committee meeting times were asked by..."
-        pattern = r'(?<=\.)\s*\n(?=[A-Z][a-zA-Z\s,&]+ (meeting times? were asked by|was asked by|asked by|stated by))'
-        
-        # Also look for clear "Per [Person]" statements that start new topics
-        pattern2 = r'(?<=\.)\s*\n(?=Per [A-Z][a-zA-Z\s,]+,)'
+        # Most paragraphs contain none of the phrases either boundary pattern needs
+        if "asked by" not in paragraph and "stated by" not in paragraph and "\nPer " not in paragraph:
+            return [paragraph.strip()] if paragraph.strip() else []
         
-        # Find split points
-        split_points = []
-        for pat in [pattern, pattern2]:
-            matches = list(re.finditer(pat, paragraph))
-            for match in matches:
-                split_points.append(match.end() - 1)  # Position just before the capital letter
+        # Find split points, already in order and distinct
+        # (each is the position just before the capital letter)
+        split_points = [match.end() - 1 for match in _CLEAR_BOUNDARY_RE.finditer(paragraph)]
         
         if not split_points:
             # No clear boundaries found, return as single comment
             return [paragraph.strip()] if paragraph.strip() else []
         
         # Split at the identified points
-        split_points = sorted(list(set(split_points)))
         comments = []
         start = 0
         
@@ -252,27 +482,18 @@ class AIMinutesAgent:
         Returns:
             List[str]: List of individual comments
         """
-        # Patterns that indicate a new speaker or comment
-        # Look for patterns like "X was asked by [Name]" or "[Name] stated/asked/etc"
-        speaker_patterns = [
-            r'(?:^|\.\s+)([A-Z][a-zA-Z\s&,]+(?:asked|stated|mentioned|said|commented|noted|expressed|inquired|requested)\s+by\s+[A-Z][a-zA-Z\s,]+)',
-            r'(?:^|\.\s+)([A-Z][a-zA-Z\s&,]+\s+(?:was|were)\s+asked\s+by\s+[A-Z][a-zA-Z\s,]+)',
-            r'(?:^|\.\s+)(Per\s+[A-Z][a-zA-Z\s,]+)',
-        ]
+        # Skip the speaker patterns when none of their keywords appear
+        if not any(keyword in paragraph for keyword in _SPEAKER_KEYWORDS):
+            return [paragraph.strip()] if paragraph.strip() else []
         
-        # Find all potential split points
+        # Find all potential split points, already in order and distinct
         split_points = []
         
-        for pattern in speaker_patterns:
-            matches = list(re.finditer(pattern, paragraph))
-            for match in matches:
-                start_pos = match.start()
-                # Don't split at the very beginning unless it starts with a sentence
-                if start_pos > 10 or paragraph[:start_pos].strip().endswith('.'):
-                    split_points.append(start_pos)
-        
-        # Remove duplicates and sort
-        split_points = sorted(list(set(split_points)))
+        for match in _SPEAKER_RE.finditer(paragraph):
+            start_pos = match.start()
+            # Don't split at the very beginning unless it starts with a sentence
+            if start_pos > 10 or paragraph[:start_pos].strip().endswith('.'):
+                split_points.append(start_pos)
         
         if not split_points:
             # No clear speaker boundaries found, return as single comment
@@ -286,7 +507,7 @@ class AIMinutesAgent:
             if start < split_point:
                 comment = paragraph[start:split_point].strip()
                 # Clean up leading punctuation and whitespace
-                comment = re.sub(r'^[.\s]+', '', comment).strip()
+                comment = _LEADING_PUNCTUATION_RE.sub('', comment).strip()
                 if len(comment) > 30:  # Only include substantial comments
                     comments.append(comment)
             start = split_point
@@ -295,7 +516,7 @@ class AIMinutesAgent:
         if start < len(paragraph):
             final_comment = paragraph[start:].strip()
             # Clean up leading punctuation and whitespace
-            final_comment = re.sub(r'^[.\s]+', '', final_comment).strip()
+            final_comment = _LEADING_PUNCTUATION_RE.sub('', final_comment).strip()
             if len(final_comment) > 30:
                 comments.append(final_comment)
         
@@ -316,35 +537,27 @@ class AIMinutesAgent:
             bool: True if section contains only administrative content
         """
         # Remove whitespace and newlines for analysis
-        clean_text = re.sub(r'\s+', ' ', text.strip())
+        clean_text = ' '.join(text.split())
         
         # If the text is very short (likely just whitespace or minimal content)
         if len(clean_text) < 10:
             return True
         
-        # Patterns that indicate administrative-only content
-        admin_only_patterns = [
-            r'^[A-Za-z0-9\s\-:]+envelope\s+id[:\s]*[A-Za-z0-9\-]+\s*$',  # Just Docusign ID
-            r'^page\s+\d+\s*$',  # Just page number
-            r'^continued\s*$',  # Just "continued"
-            r'^end\s*$',  # Just "end"
-            r'^\s*$',  # Just whitespace
-        ]
-        
-        for pattern in admin_only_patterns:
-            if re.match(pattern, clean_text, re.IGNORECASE):
+        for pattern in _ADMIN_ONLY_PATTERNS:
+            if pattern.match(clean_text):
                 return True
         
         # If text only contains common administrative phrases
-        admin_words = ['docusign', 'envelope', 'id', 'page', 'continued', 'end']
         words = clean_text.lower().split()
-        non_admin_words = [w for w in words if not any(admin in w for admin in admin_words)]
+        non_admin_words = 0
+        for word in words:
+            if not _ADMIN_WORD_RE.search(word):
+                non_admin_words += 1
+                if non_admin_words == 3:
+                    return False
         
         # If less than 3 non-administrative words, likely admin-only
-        if len(non_admin_words) < 3:
-            return True
-        
-        return False
+        return True
     
     def is_admin_paragraph(self, paragraph: str) -> bool:
         """
@@ -358,35 +571,27 @@ class AIMinutesAgent:
         """
         clean_para = paragraph.strip().lower()
         
+        # Page furniture (a DocuSign envelope header, a page number) is a block of its
+        # own in the extracted text, repeated on every page an Open Forum section
+        # spans, and can be longer than the short-paragraph limit below
+        if any(pattern.match(clean_para) for pattern in _ADMIN_ONLY_PATTERNS):
+            return True
+        
         # If the paragraph is very short and only contains admin content
-        if len(clean_para) < 50:
-            admin_patterns = [
-                r'docusign\s+envelope\s+id:',
-                r'page\s+\d+',
-                r'^continued\s*$',
-                r'^end\s*$',
-                r'^\s*\d+\s*$',  # Just numbers
-                r'meeting\s+id:',
-                r'zoom\s+call:',
-                r'passcode:',
-            ]
-            
-            for pattern in admin_patterns:
-                if re.search(pattern, clean_para):
+        if len(clean_para) < 50 and (clean_para.isdecimal() or
+                                     any(keyword in clean_para for keyword in _ADMIN_PARAGRAPH_KEYWORDS)):
+            for pattern in _ADMIN_PARAGRAPH_PATTERNS:
+                if pattern.search(clean_para):
                     return True
         
         # For longer paragraphs, check if it's MOSTLY administrative content
         # If it has substantial meaningful content beyond admin phrases, it's likely a real comment
         if len(clean_para) > 100:
             # Remove common admin phrases and see what's left
-            temp_text = re.sub(r'docusign\s+envelope\s+id:\s*[a-f0-9\-]+', '', clean_para, flags=re.IGNORECASE)
-            temp_text = re.sub(r'page\s+\d+', '', temp_text, flags=re.IGNORECASE)
-            temp_text = re.sub(r'meeting\s+id:\s*\d+', '', temp_text, flags=re.IGNORECASE)
-            temp_text = re.sub(r'zoom\s+call:\s*https?://[^\s]+', '', temp_text, flags=re.IGNORECASE)
-            temp_text = re.sub(r'passcode:\s*\w+', '', temp_text, flags=re.IGNORECASE)
+            temp_text = _ADMIN_PHRASE_RE.sub('', clean_para)
             
             # Clean up extra whitespace
-            temp_text = re.sub(r'\s+', ' ', temp_text).strip()
+            temp_text = ' '.join(temp_text.split())
             
             # If there's substantial content left after removing admin phrases, it's a real comment
             if len(temp_text) > 80:  # Threshold for meaningful content
@@ -394,12 +599,15 @@ class AIMinutesAgent:
         
         return False
     
-    def extract_date_from_filename(self, filename: str) -> str:
+    @staticmethod
+    @functools.lru_cache(maxsize=4096)
+    def extract_date_from_filename(filename: str) -> str:
         """
         Universal date extraction from filename using multiple approaches.
         
         This function is designed to be 99%+ accurate even with wildly varying formats.
-        It uses multiple strategies in order of reliability.
+        It uses multiple strategies in order of reliability. The result depends only
+        on the filename, so it is cached per filename.
         
         Args:
             filename (str): PDF filename
@@ -409,40 +617,11 @@ class AIMinutesAgent:
         """
         import datetime
         
-        # Strategy 1: Find all potential date patterns in the filename
-        # This covers virtually every conceivable format
-        date_patterns = [
-            # Standard formats with various separators
-            r'(\d{1,2})[.\-_/](\d{1,2})[.\-_/](\d{4})',     # M.D.YYYY, M-D-YYYY, M_D_YYYY, M/D/YYYY
-            r'(\d{1,2})[.\-_/](\d{1,2})[.\-_/](\d{2})',      # M.D.YY, M-D-YY, M_D_YY, M/D/YY
-            r'(\d{4})[.\-_/](\d{1,2})[.\-_/](\d{1,2})',      # YYYY.M.D, YYYY-M-D, etc.
-            
-            # With spaces before/after separators
-            r'\s+(\d{1,2})[.\-_/]\s*(\d{1,2})[.\-_/]\s*(\d{4})',  # " M. D. YYYY"
-            r'\s+(\d{1,2})[.\-_/]\s*(\d{1,2})[.\-_/]\s*(\d{2})',   # " M. D. YY"
-            r'(\d{1,2})\s*[.\-_/]\s*(\d{1,2})\s*[.\-_/]\s*(\d{4})', # "M . D . YYYY"
-            r'(\d{1,2})\s*[.\-_/]\s*(\d{1,2})\s*[.\-_/]\s*(\d{2})',  # "M . D . YY"
-            
-            # Compact formats (no separators)
-            r'(\d{2})(\d{2})(\d{4})',    # MMDDYYYY
-            r'(\d{1})(\d{2})(\d{4})',    # MDDYYYY  
-            r'(\d{2})(\d{1})(\d{4})',    # MMDYYYY
-            r'(\d{1})(\d{1})(\d{4})',    # MDYYYY
-            r'(\d{2})(\d{2})(\d{2})',    # MMDDYY
-            
-            # With various word separators around dates
-            r'[a-zA-Z\s]+(\d{1,2})[.\-_/](\d{1,2})[.\-_/](\d{2,4})[a-zA-Z\s]*', # "Minutes 1.2.21 draft"
-        ]
-        
-        # Strategy 2: Extract all potential date candidates
-        candidates = []
-        
-        for pattern in date_patterns:
-            matches = re.finditer(pattern, filename)
-            for match in matches:
-                groups = match.groups()
-                if len(groups) == 3:
-                    candidates.append(groups)
+        # Strategy 1: Find all potential date patterns in the filename (see _DATE_PATTERNS)
+        
+        # Strategy 2: Generate the potential date candidates lazily, pattern by pattern,
+        # so that the remaining patterns never run once a candidate validates
+        candidates = (match.groups() for pattern in _DATE_PATTERNS for match in pattern.finditer(filename))
         
         # Strategy 3: Validate and normalize each candidate
         for candidate in candidates:
@@ -491,49 +670,43 @@ class AIMinutesAgent:
             except (ValueError, IndexError):
                 continue
         
-        # Strategy 4: Look for month names (January, Jan, etc.)
-        month_patterns = {
-            r'\b(jan|january)\b.*?(\d{1,2}).*?(\d{2,4})': 1,
-            r'\b(feb|february)\b.*?(\d{1,2}).*?(\d{2,4})': 2,
-            r'\b(mar|march)\b.*?(\d{1,2}).*?(\d{2,4})': 3,
-            r'\b(apr|april)\b.*?(\d{1,2}).*?(\d{2,4})': 4,
-            r'\b(may)\b.*?(\d{1,2}).*?(\d{2,4})': 5,
-            r'\b(jun|june)\b.*?(\d{1,2}).*?(\d{2,4})': 6,
-            r'\b(jul|july)\b.*?(\d{1,2}).*?(\d{2,4})': 7,
-            r'\b(aug|august)\b.*?(\d{1,2}).*?(\d{2,4})': 8,
-            r'\b(sep|september)\b.*?(\d{1,2}).*?(\d{2,4})': 9,
-            r'\b(oct|october)\b.*?(\d{1,2}).*?(\d{2,4})': 10,
-            r'\b(nov|november)\b.*?(\d{1,2}).*?(\d{2,4})': 11,
-            r'\b(dec|december)\b.*?(\d{1,2}).*?(\d{2,4})': 12,
-        }
-        
+        # Strategy 4: Look for month names (January, Jan, etc.), taking for each month
+        # the first name followed by a day and year, and trying months in calendar order
         filename_lower = filename.lower()
-        for pattern, month in month_patterns.items():
-            match = re.search(pattern, filename_lower)
-            if match:
-                try:
-                    day = int(match.group(2))
-                    year_str = match.group(3)
-                    year = int(year_str)
-                    if len(year_str) == 2:
-                        year = 2000 + year if year <= 50 else 1900 + year
-                    
-                    if 1 <= day <= 31 and 1990 <= year <= 2030:
-                        return f"{month:02d}.{day:02d}.{year}"
-                except (ValueError, IndexError):
-                    continue
+        month_matches = {}
+        for name in _MONTH_NAME_RE.finditer(filename_lower):
+            month = _MONTH_LOOKUP[name.group(1)]
+            if month not in month_matches:
+                match = _MONTH_DAY_YEAR_RE.match(filename_lower, name.end())
+                if match:
+                    month_matches[month] = match
+        
+        for month in sorted(month_matches):
+            match = month_matches[month]
+            try:
+                day = int(match.group(1))
+                year_str = match.group(2)
+                year = int(year_str)
+                if len(year_str) == 2:
+                    year = 2000 + year if year <= 50 else 1900 + year
+                
+                if 1 <= day <= 31 and 1990 <= year <= 2030:
+                    return f"{month:02d}.{day:02d}.{year}"
+            except (ValueError, IndexError):
+                continue
         
         return "Unknown Date"
     
-    def process_single_pdf(self, pdf_path: str) -> Tuple[str, Optional[int]]:
+    def analyze_pdf(self, pdf_path: str) -> Tuple[str, Optional[int], Optional[str]]:
         """
-        Process a single PDF file and extract comment count.
+        Date a single PDF file and count its public comments, without recording anything.
         
         Args:
             pdf_path (str): Path to the PDF file
             
         Returns:
-            Tuple[str, Optional[int]]: (date, comment_count) or (date, None) if skipped
+            Tuple[str, Optional[int], Optional[str]]: (date, comment_count, None), or
+                (date, None, skip_reason) if the file has no countable comments
         """
         filename = os.path.basename(pdf_path)
         date = self.extract_date_from_filename(filename)
@@ -545,22 +718,114 @@ class AIMinutesAgent:
         # Extract text from PDF
         text = self.extract_text_from_pdf(pdf_path)
         if not text:
-            self.skipped_files.append((filename, "Failed to extract text"))
-            return date, None
+            return date, None, _SKIP_NO_TEXT
         
         # Extract Open Forum section
         open_forum_text = self.extract_open_forum_section(text)
         if not open_forum_text:
-            self.skipped_files.append((filename, "No Open Forum section found"))
-            return date, None
+            return date, None, _SKIP_NO_OPEN_FORUM
         
         # Count comments
         comment_count = self.count_public_comments(open_forum_text)
         
         if comment_count == 0:
-            self.skipped_files.append((filename, "No comments or 'no comment' marker found"))
-            return date, None
+            return date, None, _SKIP_NO_COMMENTS
+        
+        return date, comment_count, None
+    
+    def analyze_pdfs(self, pdf_paths: List[str],
+                     executor: Optional[ProcessPoolExecutor] = None) -> List[Tuple[str, Optional[int], Optional[str]]]:
+        """
+        Run analyze_pdf over several PDF files, spreading them across worker processes.
+        
+        Files are independent, so they are parsed in parallel unless there is only one
+        file or debug mode is on (debug output stays readable when run in order).
+        
+        Args:
+            pdf_paths (List[str]): Paths to the PDF files
+            executor (Optional[ProcessPoolExecutor]): Pool from _worker_pool to run on;
+                a pool is started just for these files if not given
+            
+        Returns:
+            List[Tuple[str, Optional[int], Optional[str]]]: analyze_pdf results, in input order
+        """
+        self.prefetch_files(pdf_paths)
+        
+        if self.debug_mode or len(pdf_paths) < 2:
+            return [self.analyze_pdf(pdf_path) for pdf_path in pdf_paths]
+        
+        # Hand files to the workers a few at a time, keeping several chunks per worker
+        # so that a slow document does not leave the others idle
+        chunksize = max(1, len(pdf_paths) // (_CHUNKS_PER_WORKER * _MAX_WORKERS))
+        
+        if executor is None:
+            with self._worker_pool(len(pdf_paths)) as pool:
+                if pool is None:
+                    return [self.analyze_pdf(pdf_path) for pdf_path in pdf_paths]
+                return list(pool.map(_analyze_pdf_in_worker, pdf_paths, chunksize=chunksize))
+        
+        return list(executor.map(_analyze_pdf_in_worker, pdf_paths, chunksize=chunksize))
+    
+    @staticmethod
+    def prefetch_files(paths: List[str]):
+        """
+        Ask the kernel to start reading files that are about to be parsed.
+        
+        The reads happen in the background, so later files are already in the page
+        cache when their turn comes. This is only a hint: it does nothing where
+        os.posix_fadvise is unavailable (e.g. Windows, macOS) and ignores files
+        that cannot be opened, which are reported when they are parsed.
+        
+        Args:
+            paths (List[str]): Paths to the files
+        """
+        if not hasattr(os, "posix_fadvise"):
+            return
+        
+        for path in paths:
+            try:
+                fd = os.open(path, os.O_RDONLY)
+            except OSError:
+                continue
+            try:
+                os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+            except OSError:
+                pass
+            finally:
+                os.close(fd)
+    
+    def _worker_pool(self, file_count: Optional[int] = None):
+        """
+        Start the worker processes used by analyze_pdfs.
+        
+        Args:
+            file_count (Optional[int]): Number of files to be processed, if known
+            
+        Returns:
+            A ProcessPoolExecutor to use as a context manager, or a null context
+            giving None when the files are better processed in this process
+        """
+        workers = min(os.cpu_count() or 1, _MAX_WORKERS)
+        if file_count is not None:
+            workers = min(workers, file_count)
+        if self.debug_mode or workers < 2:
+            return contextlib.nullcontext()
+        return ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                   initargs=(self.debug_mode,))
+    
+    def process_single_pdf(self, pdf_path: str) -> Tuple[str, Optional[int]]:
+        """
+        Process a single PDF file and extract comment count.
         
+        Args:
+            pdf_path (str): Path to the PDF file
+            
+        Returns:
+            Tuple[str, Optional[int]]: (date, comment_count) or (date, None) if skipped
+        """
+        date, comment_count, skip_reason = self.analyze_pdf(pdf_path)
+        if skip_reason:
+            self.skipped_files.append((os.path.basename(pdf_path), skip_reason))
         return date, comment_count
     
     def process_folder(self, folder_path: str) -> Dict[str, Dict[str, int]]:
@@ -577,17 +842,14 @@ class AIMinutesAgent:
             raise FileNotFoundError(f"Folder not found: {folder_path}")
         
         yearly_results = {}
-        self.meeting_stats = {}  # Store comprehensive meeting statistics
+        self._reset_meeting_stats()
         total_pdf_files = 0
         
         # Find all yearly folders (e.g., 2020-2021, 2021-2022, etc.)
-        yearly_folders = []
-        for item in os.listdir(folder_path):
-            item_path = os.path.join(folder_path, item)
-            if os.path.isdir(item_path) and re.match(r'\d{4}-\d{4}', item):
-                yearly_folders.append((item, item_path))
-        
-        yearly_folders.sort()  # Sort by year
+        # (the name is checked first, and DirEntry.is_dir() reuses the type from the listing)
+        with os.scandir(folder_path) as entries:
+            yearly_folders = sorted((entry.name, entry.path) for entry in entries
+                                    if _YEAR_FOLDER_RE.match(entry.name) and entry.is_dir())
         
         if not yearly_folders:
             print("No yearly folders found. Falling back to processing all PDF files in the folder...")
@@ -595,85 +857,137 @@ class AIMinutesAgent:
         
         print(f"Found {len(yearly_folders)} yearly folders: {[year for year, _ in yearly_folders]}")
         
-        # Process each yearly folder
-        for year_name, year_path in yearly_folders:
-            print(f"\nProcessing academic year: {year_name}")
-            
-            # Look for Minutes subfolder within the year - handle both "Minutes" and "Minute"
-            minutes_path = os.path.join(year_path, "Minutes")
-            if not os.path.exists(minutes_path):
-                # Try "Minute" (singular) as fallback
-                minutes_path = os.path.join(year_path, "Minute")
+        # Process each yearly folder, sharing one pool of worker processes across the years
+        with self._worker_pool() as executor:
+            for year_name, year_path in yearly_folders:
+                print(f"\nProcessing academic year: {year_name}")
+                
+                # Look for Minutes subfolder within the year - handle both "Minutes" and "Minute"
+                minutes_path = os.path.join(year_path, "Minutes")
                 if not os.path.exists(minutes_path):
-                    print(f"  No 'Minutes' or 'Minute' folder found in {year_name}, skipping...")
-                    continue
-            
-            year_results, year_stats = self.process_single_year_folder_with_stats(minutes_path)
-            yearly_results[year_name] = year_results
-            self.meeting_stats[year_name] = year_stats
-            
-            year_file_count = sum(1 for _ in year_results.values())
-            total_pdf_files += year_stats['total_meetings']
-            
-            print(f"  Found {year_file_count} files with comments in {year_name}")
+                    # Try "Minute" (singular) as fallback
+                    minutes_path = os.path.join(year_path, "Minute")
+                    if not os.path.exists(minutes_path):
+                        print(f"  No 'Minutes' or 'Minute' folder found in {year_name}, skipping...")
+                        continue
+                
+                year_results, year_stats = self.process_single_year_folder_with_stats(minutes_path, executor)
+                yearly_results[year_name] = year_results
+                self.year_index[year_name] = len(self.years)
+                self.years.append(year_name)
+                self.total_meetings.append(year_stats['total_meetings'])
+                self.meetings_with_comments.append(year_stats['meetings_with_comments'])
+                self.meetings_no_comments.append(year_stats['meetings_no_comments'])
+                self.meetings_no_open_forum.append(year_stats['meetings_no_open_forum'])
+                self.total_comments.append(year_stats['total_comments'])
+                
+                year_file_count = sum(1 for _ in year_results.values())
+                total_pdf_files += year_stats['total_meetings']
+                
+                print(f"  Found {year_file_count} files with comments in {year_name}")
         
         self.processing_stats['total_files'] = total_pdf_files
         
         return yearly_results
     
-    def process_single_year_folder(self, folder_path: str) -> Dict[str, int]:
+    @staticmethod
+    def _sort_yearly(yearly_data: Dict[str, Dict[str, int]]) -> List[Tuple[str, List[Tuple[str, int]]]]:
+        """
+        Sort yearly data by academic year and each year's entries by date.
+        
+        Args:
+            yearly_data (Dict[str, Dict[str, int]]): Yearly comment count data
+            
+        Returns:
+            List[Tuple[str, List[Tuple[str, int]]]]: (year, [(date, count), ...]) in order
+        """
+        # Dates are unique keys, so plain tuple ordering sorts by date. Results from
+        # process_folder are built in order, so for them each sort is a single linear
+        # pass, but callers may have changed the data since, so it is always sorted.
+        return [(year, sorted(yearly_data[year].items())) for year in sorted(yearly_data)]
+    
+    def find_pdf_files(self, folder_path: str) -> List[str]:
+        """
+        Find all PDF files in a folder and its subfolders.
+        
+        Walks the tree with os.scandir, which reports each entry's type from the
+        directory listing itself, and visits files in the same order as os.walk.
+        Symlinked folders are not descended into and unreadable folders are skipped.
+        
+        Args:
+            folder_path (str): Path to the folder to search
+            
+        Returns:
+            List[str]: Paths of the PDF files found
+        """
+        pdf_files = []
+        folders = [folder_path]
+        
+        while folders:
+            folder = folders.pop()
+            subfolders = []
+            try:
+                with os.scandir(folder) as entries:
+                    for entry in entries:
+                        if entry.is_dir():
+                            if not entry.is_symlink():
+                                subfolders.append(entry.path)
+                        elif entry.name.lower().endswith('.pdf'):
+                            pdf_files.append(entry.path)
+            except OSError:
+                continue
+            
+            # Reversed so that subfolders are popped in listing order
+            folders.extend(reversed(subfolders))
+        
+        return pdf_files
+    
+    def process_single_year_folder(self, folder_path: str,
+                                   executor: Optional[ProcessPoolExecutor] = None) -> Dict[str, int]:
         """
         Process PDF files in a single folder (for one academic year).
         
         Args:
             folder_path (str): Path to folder containing PDF files
+            executor (Optional[ProcessPoolExecutor]): Worker pool to share, see analyze_pdfs
             
         Returns:
-            Dict[str, int]: Dictionary mapping dates to comment counts
+            Dict[str, int]: Dictionary mapping dates to comment counts, in date order
         """
         comment_count_map = {}
-        pdf_files = []
-        
-        # Find all PDF files in this folder
-        for root, _, files in os.walk(folder_path):
-            for file in files:
-                if file.lower().endswith('.pdf'):
-                    pdf_files.append(os.path.join(root, file))
+        pdf_files = self.find_pdf_files(folder_path)
         
         if self.debug_mode:
             print(f"    Processing {len(pdf_files)} PDF files in {folder_path}")
         
-        # Process each PDF file
-        for pdf_path in pdf_files:
-            date, comment_count = self.process_single_pdf(pdf_path)
-            
+        # Process the PDF files, then record the results
+        for pdf_path, (date, comment_count, skip_reason) in zip(pdf_files, self.analyze_pdfs(pdf_files, executor)):
             if comment_count is not None:
                 comment_count_map[date] = comment_count
                 self.processing_stats['processed_files'] += 1
                 self.processing_stats['total_comments'] += comment_count
             else:
+                self.skipped_files.append((os.path.basename(pdf_path), skip_reason))
                 self.processing_stats['skipped_files'] += 1
         
-        return comment_count_map
+        # Files are found in folder order, so put the dates in order once here
+        return dict(sorted(comment_count_map.items()))
     
-    def process_single_year_folder_with_stats(self, folder_path: str) -> Tuple[Dict[str, int], Dict[str, int]]:
+    def process_single_year_folder_with_stats(self, folder_path: str,
+                                              executor: Optional[ProcessPoolExecutor] = None
+                                              ) -> Tuple[Dict[str, int], Dict[str, int]]:
         """
         Process PDF files in a single folder with comprehensive statistics.
         
         Args:
             folder_path (str): Path to folder containing PDF files
+            executor (Optional[ProcessPoolExecutor]): Worker pool to share, see analyze_pdfs
             
         Returns:
-            Tuple[Dict[str, int], Dict[str, int]]: (comment_counts, meeting_stats)
+            Tuple[Dict[str, int], Dict[str, int]]: (comment_counts in date order, meeting_stats)
         """
         comment_count_map = {}
-        pdf_files = []
-        
-        # Find all PDF files in this folder
-        for root, _, files in os.walk(folder_path):
-            for file in files:
-                if file.lower().endswith('.pdf'):
-                    pdf_files.append(os.path.join(root, file))
+        pdf_files = self.find_pdf_files(folder_path)
         
         total_meetings = len(pdf_files)
         meetings_with_comments = 0
@@ -684,35 +998,19 @@ class AIMinutesAgent:
         if self.debug_mode:
             print(f"    Processing {len(pdf_files)} PDF files in {folder_path}")
         
-        # Process each PDF file
-        for pdf_path in pdf_files:
-            filename = os.path.basename(pdf_path)
-            date = self.extract_date_from_filename(filename)
-            
-            # Extract text from PDF
-            text = self.extract_text_from_pdf(pdf_path)
-            if not text:
-                meetings_no_open_forum += 1
-                continue
-            
-            # Extract Open Forum section
-            open_forum_text = self.extract_open_forum_section(text)
-            if not open_forum_text:
+        # Process the PDF files, then tally the results
+        for date, comment_count, skip_reason in self.analyze_pdfs(pdf_files, executor):
+            if skip_reason == _SKIP_NO_COMMENTS:
+                meetings_no_comments += 1
+                self.processing_stats['skipped_files'] += 1
+            elif skip_reason:
                 meetings_no_open_forum += 1
-                continue
-            
-            # Count comments
-            comment_count = self.count_public_comments(open_forum_text)
-            
-            if comment_count > 0:
+            else:
                 comment_count_map[date] = comment_count
                 meetings_with_comments += 1
                 total_comments += comment_count
                 self.processing_stats['processed_files'] += 1
                 self.processing_stats['total_comments'] += comment_count
-            else:
-                meetings_no_comments += 1
-                self.processing_stats['skipped_files'] += 1
         
         # Compile statistics
         stats = {
@@ -723,32 +1021,101 @@ class AIMinutesAgent:
             'total_comments': total_comments
         }
         
-        return comment_count_map, stats
+        # Files are found in folder order, so put the dates in order once here
+        return dict(sorted(comment_count_map.items())), stats
 
-    def export_to_csv(self, yearly_data: Dict[str, Dict[str, int]], output_path: str = "open_forum_summary.csv"):
+    def export_to_csv(self, yearly_data: Dict[str, Dict[str, int]], output_path: str = "open_forum_summary.csv") -> bool:
         """
         Export results to CSV file, organized by academic years.
         
         Args:
             yearly_data (Dict[str, Dict[str, int]]): Yearly comment count data
             output_path (str): Output CSV file path
+            
+        Returns:
+            bool: True if the file was written, False if writing it failed
         """
+        # With no data the file is just the header, with nothing to sort or check
+        rows = []
+        text = _CSV_HEADER
+        needs_quoting = False
+        
+        if yearly_data:
+            # Sort by academic year and then by date
+            rows = [(year, date, count)
+                    for year, year_items in self._sort_yearly(yearly_data)
+                    for date, count in year_items]
+            
+            # Years, dates and counts normally need no CSV quoting, so the lines are
+            # formatted directly (with the csv module's "\r\n" line ending). A field
+            # that does need quoting adds a comma, quote or line break to the text,
+            # and then the csv module writes the rows instead.
+            text = "".join([_CSV_HEADER] + [f"{year},{date},{count}\r\n" for year, date, count in rows])
+            line_count = len(rows) + 1
+            needs_quoting = (text.count(",") != 2 * line_count or '"' in text or
+                             text.count("\n") != line_count or text.count("\r") != line_count)
+        
         try:
-            with open(output_path, 'w', newline='', encoding='utf-8') as csvfile:
-                writer = csv.writer(csvfile)
-                writer.writerow(['Academic_Year', 'Date', 'Comment_Count'])
-                
-                # Sort by academic year and then by date
-                for year in sorted(yearly_data.keys()):
-                    year_data = yearly_data[year]
-                    sorted_data = sorted(year_data.items(), key=lambda x: x[0])
-                    for date, count in sorted_data:
-                        writer.writerow([year, date, count])
+            # A large buffer lets the csv module's rows go out in a few big writes
+            with open(output_path, 'w', newline='', encoding='utf-8', buffering=_CSV_BUFFER_SIZE) as csvfile:
+                if needs_quoting:
+                    writer = csv.writer(csvfile)
+                    writer.writerow(['Academic_Year', 'Date', 'Comment_Count'])
+                    writer.writerows(rows)
+                else:
+                    csvfile.write(text)
             
             print(f"Results exported to: {output_path}")
+            return True
             
-        except Exception as e:
+        except OSError as e:
             print(f"Error exporting to CSV: {e}")
+            return False
+    
+    def export_to_parquet(self, yearly_data: Dict[str, Dict[str, int]], output_path: str = "open_forum_summary.parquet") -> bool:
+        """
+        Export results to a Parquet file with the same columns as the CSV export.
+        
+        Parquet stores each column together (with the few academic years dictionary
+        encoded), so the file is smaller than the CSV and loads without text parsing.
+        Requires the optional pyarrow package.
+        
+        Args:
+            yearly_data (Dict[str, Dict[str, int]]): Yearly comment count data
+            output_path (str): Output Parquet file path
+            
+        Returns:
+            bool: True if the file was written, False if pyarrow is missing or writing failed
+        """
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError:
+            print("Error exporting to Parquet: pyarrow is not installed (pip install pyarrow)")
+            return False
+        
+        # Build the columns directly, sorted by academic year and then by date
+        years, dates, counts = [], [], []
+        for year, year_items in self._sort_yearly(yearly_data):
+            years.extend([year] * len(year_items))
+            for date, count in year_items:
+                dates.append(date)
+                counts.append(count)
+        
+        table = pa.table({
+            'Academic_Year': pa.array(years, type=pa.string()).dictionary_encode(),
+            'Date': pa.array(dates, type=pa.string()),
+            'Comment_Count': pa.array(counts, type=pa.int32()),
+        })
+        
+        try:
+            pq.write_table(table, output_path, compression='zstd')
+            print(f"Results exported to: {output_path}")
+            return True
+            
+        except OSError as e:
+            print(f"Error exporting to Parquet: {e}")
+            return False
     
     def print_summary(self, yearly_data: Dict[str, Dict[str, int]]):
         """
@@ -757,87 +1124,136 @@ class AIMinutesAgent:
         Args:
             yearly_data (Dict[str, Dict[str, int]]): Yearly comment count data
         """
-        print("\n" + "="*70)
-        print("🎯 AI MINUTES AGENT - COMPREHENSIVE MEETING ANALYSIS")
-        print("="*70)
+        # The report is collected here and written out in one go at the end
+        parts = []
+        
+        # Statistics and sorted data are bound to local names once for the loops below
+        year_index_get = self.year_index.get
+        total_meetings_by_year = self.total_meetings
+        with_comments_by_year = self.meetings_with_comments
+        no_comments_by_year = self.meetings_no_comments
+        no_open_forum_by_year = self.meetings_no_open_forum
+        comments_by_year = self.total_comments
+        sorted_yearly = self._sort_yearly(yearly_data)
+        
+        # Participation rate of each year, computed once for both the breakdown and the table
+        rate_by_year = [(with_comments / total * 100) if total > 0 else 0
+                        for with_comments, total in zip(with_comments_by_year, total_meetings_by_year)]
+        
+        parts.append("\n" + _DOUBLE_RULE + "\n")
+        parts.append("🎯 AI MINUTES AGENT - COMPREHENSIVE MEETING ANALYSIS\n")
+        parts.append(_DOUBLE_RULE + "\n")
         
         # Overall statistics
-        total_all_meetings = sum(stats.get('total_meetings', 0) for stats in getattr(self, 'meeting_stats', {}).values())
-        total_meetings_with_comments = sum(stats.get('meetings_with_comments', 0) for stats in getattr(self, 'meeting_stats', {}).values())
-        total_all_comments = sum(stats.get('total_comments', 0) for stats in getattr(self, 'meeting_stats', {}).values())
-        
-        print(f"📊 OVERALL STATISTICS")
-        print(f"Total meetings across all years: {total_all_meetings}")
-        print(f"Meetings with public comments: {total_meetings_with_comments}")
-        print(f"Meetings without public comments: {total_all_meetings - total_meetings_with_comments}")
+        total_all_meetings = sum(total_meetings_by_year)
+        total_meetings_with_comments = sum(with_comments_by_year)
+        total_all_comments = sum(comments_by_year)
+        
+        parts.append(f"📊 OVERALL STATISTICS\n")
+        parts.append(f"Total meetings across all years: {total_all_meetings}\n")
+        parts.append(f"Meetings with public comments: {total_meetings_with_comments}\n")
+        parts.append(f"Meetings without public comments: {total_all_meetings - total_meetings_with_comments}\n")
         if total_all_meetings > 0:
             participation_rate = (total_meetings_with_comments / total_all_meetings) * 100
-            print(f"Public participation rate: {participation_rate:.1f}%")
-        print(f"Total public comments found: {total_all_comments}")
+            parts.append(f"Public participation rate: {participation_rate:.1f}%\n")
+        parts.append(f"Total public comments found: {total_all_comments}\n")
         
-        if yearly_data and hasattr(self, 'meeting_stats'):
-            print(f"\n📅 YEARLY BREAKDOWN:")
-            print("="*70)
+        if yearly_data:
+            parts.append(f"\n📅 YEARLY BREAKDOWN:\n")
+            parts.append(_DOUBLE_RULE + "\n")
             
-            for year in sorted(yearly_data.keys()):
-                year_data = yearly_data[year]
-                year_stats = self.meeting_stats.get(year, {})
-                
-                total_meetings = year_stats.get('total_meetings', 0)
-                meetings_with_comments = year_stats.get('meetings_with_comments', 0)
-                meetings_no_comments = year_stats.get('meetings_no_comments', 0)
-                meetings_no_open_forum = year_stats.get('meetings_no_open_forum', 0)
-                total_comments = year_stats.get('total_comments', 0)
+            for year, year_items in sorted_yearly:
+                i = year_index_get(year)
+                total_meetings = total_meetings_by_year[i] if i is not None else 0
                 
                 if total_meetings > 0:
-                    participation_rate = (meetings_with_comments / total_meetings) * 100
-                    print(f"\n📅 {year}")
-                    print(f"📋 Total meetings held: {total_meetings}")
-                    print(f"💬 Meetings with public comments: {meetings_with_comments}")
-                    print(f"🚫 Meetings with no comments: {meetings_no_comments}")
-                    print(f"❌ Meetings with no Open Forum: {meetings_no_open_forum}")
-                    print(f"📈 Public participation rate: {participation_rate:.1f}%")
-                    print(f"💯 Total comments: {total_comments}")
-                    print("-" * 50)
+                    meetings_with_comments = with_comments_by_year[i]
+                    meetings_no_comments = no_comments_by_year[i]
+                    meetings_no_open_forum = no_open_forum_by_year[i]
+                    total_comments = comments_by_year[i]
+                    participation_rate = rate_by_year[i]
+                    parts.append(f"\n📅 {year}\n")
+                    parts.append(f"📋 Total meetings held: {total_meetings}\n")
+                    parts.append(f"💬 Meetings with public comments: {meetings_with_comments}\n")
+                    parts.append(f"🚫 Meetings with no comments: {meetings_no_comments}\n")
+                    parts.append(f"❌ Meetings with no Open Forum: {meetings_no_open_forum}\n")
+                    parts.append(f"📈 Public participation rate: {participation_rate:.1f}%\n")
+                    parts.append(f"💯 Total comments: {total_comments}\n")
+                    parts.append(_SHORT_RULE + "\n")
                     
-                    if year_data:
-                        sorted_data = sorted(year_data.items(), key=lambda x: x[0])
-                        for date, count in sorted_data:
-                            print(f"  📝 {date}: {count} comment{'s' if count != 1 else ''}")
+                    if year_items:
+                        for date, count in year_items:
+                            parts.append(f"  📝 {date}: {count} comment{_PLURAL_S[count != 1]}\n")
                     else:
-                        print("  (No meetings with public comments)")
+                        parts.append("  (No meetings with public comments)\n")
                 else:
-                    print(f"\n📅 {year}: No meeting data found")
-        
-        # Summary statistics table
-        print(f"\n" + "="*70)
-        print("📈 PARTICIPATION SUMMARY TABLE")
-        print("="*70)
-        print(f"{'Year':<12} {'Total':<7} {'w/Comments':<12} {'Rate':<8} {'Comments':<10}")
-        print("-" * 70)
-        
-        if hasattr(self, 'meeting_stats'):
-            for year in sorted(yearly_data.keys()):
-                year_stats = self.meeting_stats.get(year, {})
-                total = year_stats.get('total_meetings', 0)
-                with_comments = year_stats.get('meetings_with_comments', 0)
-                total_comments = year_stats.get('total_comments', 0)
-                rate = (with_comments / total * 100) if total > 0 else 0
-                
-                print(f"{year:<12} {total:<7} {with_comments:<12} {rate:<7.1f}% {total_comments:<10}")
+                    parts.append(f"\n📅 {year}: No meeting data found\n")
         
-        # Final totals
-        print("-" * 70)
-        print(f"{'TOTAL':<12} {total_all_meetings:<7} {total_meetings_with_comments:<12} {(total_meetings_with_comments/total_all_meetings*100) if total_all_meetings > 0 else 0:<7.1f}% {total_all_comments:<10}")
+        # Summary statistics table: fixed heading, one row per year, then the totals
+        parts.append(_TABLE_HEADER)
+        
+        for year, _ in sorted_yearly:
+            i = year_index_get(year)
+            if i is None:
+                total = with_comments = total_comments = rate = 0
+            else:
+                total = total_meetings_by_year[i]
+                with_comments = with_comments_by_year[i]
+                total_comments = comments_by_year[i]
+                rate = rate_by_year[i]
+            
+            parts.append(_ROW_FMT(year, total, with_comments, rate, total_comments))
         
-        if self.skipped_files and self.debug_mode:
-            print(f"\n🔍 DETAILED SKIP REASONS ({len(self.skipped_files)} files):")
-            print("-" * 50)
-            for filename, reason in self.skipped_files:
-                print(f"- {filename}: {reason}")
+        # Final totals
+        parts.append(_RULE + "\n")
+        parts.append(_ROW_FMT('TOTAL', total_all_meetings, total_meetings_with_comments,
+                              (total_meetings_with_comments/total_all_meetings*100) if total_all_meetings > 0 else 0,
+                              total_all_comments))
+        
+        # Only debug runs list skipped files, so test debug_mode first
+        if self.debug_mode and self.skipped_files:
+            parts.append(f"\n🔍 DETAILED SKIP REASONS ({len(self.skipped_files)} files):\n")
+            parts.append(_SHORT_RULE + "\n")
+            parts.extend(f"- {filename}: {reason}\n" for filename, reason in self.skipped_files)
+        
+        if self.debug_mode and any(self.open_forum_variant_hits):
+            parts.append(f"\n🔍 OPEN FORUM PATTERN HITS:\n")
+            parts.append(_SHORT_RULE + "\n")
+            for i, hits in enumerate(self.open_forum_variant_hits):
+                parts.append(f"- pattern {i+1} ({_OPEN_FORUM_VARIANTS[i][1]}): {hits}\n")
+        
+        parts.append(f"\n🎉 Analysis complete! Check the results above for insights into public participation patterns.\n")
+        parts.append(_DOUBLE_RULE + "\n")
+        
+        sys.stdout.write("".join(parts))
+
+
+# Agent used by each worker process of AIMinutesAgent.analyze_pdfs
+_worker_agent = None
+
+
+def _init_worker(debug_mode: bool):
+    """
+    Create the agent for a worker process.
+    
+    Args:
+        debug_mode (bool): Debug setting of the agent that started the worker
+    """
+    global _worker_agent
+    _worker_agent = AIMinutesAgent(debug_mode=debug_mode)
+
+
+def _analyze_pdf_in_worker(pdf_path: str) -> Tuple[str, Optional[int], Optional[str]]:
+    """
+    Analyze one PDF file with the worker process's agent.
+    
+    Args:
+        pdf_path (str): Path to the PDF file
         
-        print(f"\n🎉 Analysis complete! Check the results above for insights into public participation patterns.")
-        print("="*70)
+    Returns:
+        Tuple[str, Optional[int], Optional[str]]: See AIMinutesAgent.analyze_pdf
+    """
+    return _worker_agent.analyze_pdf(pdf_path)
 
 
 def main():
@@ -866,6 +1282,16 @@ def main():
         default="open_forum_summary.csv",
         help="Output CSV filename (default: open_forum_summary.csv)"
     )
+    parser.add_argument(
+        "--export-parquet",
+        action="store_true",
+        help="Export results to Parquet file (requires pyarrow)"
+    )
+    parser.add_argument(
+        "--parquet-output",
+        default="open_forum_summary.parquet",
+        help="Output Parquet filename (default: open_forum_summary.parquet)"
+    )
     
     args = parser.parse_args()
     
@@ -883,14 +1309,24 @@ def main():
         agent.print_summary(yearly_data)
         
         # Export to CSV if requested
+        exported = True
         if args.export_csv:
-            agent.export_to_csv(yearly_data, args.csv_output)
+            exported = agent.export_to_csv(yearly_data, args.csv_output) and exported
+        
+        # Export to Parquet if requested
+        if args.export_parquet:
+            exported = agent.export_to_parquet(yearly_data, args.parquet_output) and exported
+        
+        # A failed export fails the run, so scripts notice the missing file
+        if not exported:
+            sys.exit(1)
         
         # Return the results
         return yearly_data
         
     except Exception as e:
         print(f"Error: {e}")
+        print(traceback.format_exc(), file=sys.stderr)
         sys.exit(1)
 
 